@@ -101,6 +101,12 @@ class FunctionCall(ASTNode): pass
 
 # --- I/O & Debug ---
 class Input(ASTNode): pass
+class InputAll(ASTNode): pass
+class InputLines(ASTNode): pass
+class InputEof(ASTNode): pass
+class MapFile(ASTNode): pass
+class SplitColumns(ASTNode): pass
 class Print(ASTNode): pass
 class FfiCall(ASTNode): pass
-class DebugBreak(ASTNode): pass
\ No newline at end of file
+class DebugBreak(ASTNode): pass
+class Snapshot(ASTNode): pass
\ No newline at end of file
@@ -17,7 +17,7 @@ class Opcode(IntEnum):
     JUMP = auto(); JUMP_IF_FALSE = auto()
     
     # Functions
-    CALL = auto(); RETURN = auto(); BUILD_CLOSURE = auto()
+    CALL = auto(); RETURN = auto(); BUILD_CLOSURE = auto(); BIND_ARGS = auto()
     
     # Data Structures
     BUILD_LIST = auto(); BUILD_MAP = auto()
@@ -25,4 +25,11 @@ class Opcode(IntEnum):
     
     # I/O, Debug, and System
     PRINT = auto(); INPUT = auto()
-    FFI_CALL = auto(); DBG = auto(); HALT = auto()
\ No newline at end of file
+    INPUT_ALL = auto(); INPUT_LINES = auto(); INPUT_EOF = auto(); MAP_FILE = auto(); SPLIT_COLUMNS = auto()
+    FFI_CALL = auto(); DBG = auto(); SNAPSHOT = auto(); HALT = auto()
+
+# Opcodes followed by one inline operand in the chunk
+OPERAND_OPCODES = {
+    Opcode.PUSH, Opcode.STORE_NAME, Opcode.LOAD_NAME, Opcode.JUMP, Opcode.JUMP_IF_FALSE,
+    Opcode.BUILD_CLOSURE, Opcode.BIND_ARGS, Opcode.BUILD_LIST, Opcode.BUILD_MAP,
+}
\ No newline at end of file
@@ -1,15 +1,51 @@
 # src/sym/compiler.py
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from sym import ast, bytecode
 
+# Largest function body (in AST nodes, nested inlined calls included) that
+# `&name @` call sites expand in place instead of building a closure.
+INLINE_MAX_NODES = 16
+
+# Net stack effect and required stack depth of simple statements.
+STACK_EFFECTS = {
+    ast.Push: (1, 0), ast.Load: (1, 0), ast.FunctionRef: (1, 0),
+    ast.Add: (-1, 2), ast.Sub: (-1, 2), ast.Mul: (-1, 2), ast.Div: (-1, 2), ast.Mod: (-1, 2),
+    ast.Eq: (-1, 2), ast.Neq: (-1, 2), ast.Lt: (-1, 2), ast.Gt: (-1, 2), ast.Lte: (-1, 2), ast.Gte: (-1, 2),
+    ast.And: (-1, 2), ast.Or: (-1, 2), ast.Not: (0, 1),
+    ast.Dup: (1, 1), ast.Swap: (0, 2), ast.Drop: (-1, 1), ast.Rot: (0, 3),
+    ast.Store: (-1, 1), ast.GetItem: (-1, 2), ast.SetItem: (-2, 3), ast.Length: (0, 1),
+}
+
+class InlineInfo:
+    """What the compiler learned about a function body while checking it can be inlined."""
+    def __init__(self, params: List[str], stored: Set[str]):
+        self.params = params; self.stored = stored
+        self.free: Set[str] = set() # Names the body reads from the global scope
+        self.size = 0
+
 class Compiler:
-    def __init__(self):
+    def __init__(self, inline: bool = True):
         self.chunks = {}
         self.debug_maps = {}
         self.visiting_chunk = None
         self.visiting_debug_map = None
+        self.visiting_locals: Set[str] = set() # Names that live in the current frame's locals
+        self.visiting_main = False # Stores in the main chunk go to the global scope, so nothing is inlined there
+        self.inline = inline
+        self.functions: Dict[str, ast.FunctionDef] = {}
+        self.inline_cache: Dict[str, Optional[InlineInfo]] = {}
+        self.inline_in_progress: Set[str] = set()
+        self.renames: Dict[str, str] = {}
+        self.inline_count = 0
 
     def compile(self, program: ast.Program) -> Tuple[Dict, Dict]:
+        # A name defined more than once, even in a nested definition, maps to whichever
+        # chunk was compiled last, so it is never inlined
+        defined = [func.name for func in function_defs(program)]
+        for stmt in program.statements:
+            if isinstance(stmt, ast.FunctionDef) and defined.count(stmt.name) == 1:
+                self.functions[stmt.name] = stmt
+
         # Compile functions first
         for stmt in program.statements:
             if isinstance(stmt, ast.FunctionDef):
@@ -18,9 +54,9 @@ class Compiler:
         # Compile the main script body
         self.visiting_chunk = []
         self.visiting_debug_map = []
-        for stmt in program.statements:
-            if not isinstance(stmt, ast.FunctionDef):
-                self.visit(stmt)
+        self.visiting_locals = set()
+        self.visiting_main = True
+        self.visit_statements([stmt for stmt in program.statements if not isinstance(stmt, ast.FunctionDef)])
         
         self.emit(bytecode.Opcode.HALT, node=program)
         self.chunks['__main__'] = self.visiting_chunk
@@ -48,8 +84,119 @@ class Compiler:
     def generic_visit(self, node):
         raise NotImplementedError(f"Compiler cannot visit {type(node).__name__}")
 
-    def visit_Program(self, node: ast.Program):
-        for stmt in node.statements: self.visit(stmt)
+    def visit_Program(self, node: ast.Program): self.visit_statements(node.statements)
+
+    def visit_statements(self, statements: List[ast.ASTNode]):
+        i = 0
+        while i < len(statements):
+            stmt = statements[i]
+            if (isinstance(stmt, ast.FunctionRef) and i + 1 < len(statements)
+                    and isinstance(statements[i + 1], ast.FunctionCall)
+                    and self.can_inline(stmt.name)):
+                self.emit_inline(stmt.name, statements[i + 1])
+                i += 2
+                continue
+            self.visit(stmt)
+            i += 1
+
+    # --- Inlining ---
+    def can_inline(self, name: str) -> bool:
+        # In the main chunk the inlined temporaries would become globals that outlive the call
+        if not self.inline or self.visiting_main: return False
+        info = self.inline_info(name)
+        # A global read by the callee must not be shadowed by a local of the caller's frame
+        return info is not None and not (info.free & self.visiting_locals)
+
+    def inline_info(self, name: str) -> Optional[InlineInfo]:
+        if name in self.inline_cache: return self.inline_cache[name]
+        if name not in self.functions or name in self.inline_in_progress: return None
+
+        func = self.functions[name]
+        info = InlineInfo(func.params, stored_names(func.body) - set(func.params))
+        self.inline_in_progress.add(name)
+        depth = self.analyze_inline(func.body.statements, 0, set(), info)
+        self.inline_in_progress.discard(name)
+
+        # The body must leave exactly its return value, as RETURN would
+        if depth != 1 or info.size > INLINE_MAX_NODES: info = None
+        self.inline_cache[name] = info
+        return info
+
+    def analyze_inline(self, statements: List[ast.ASTNode], depth: int, assigned: Set[str], info: InlineInfo) -> Optional[int]:
+        """Returns the stack depth after `statements`, or None if they cannot be inlined.
+
+        Depth is relative to the stack after the arguments were popped; dipping
+        below it would read values the caller owns, so it is rejected.
+        """
+        i = 0
+        while i < len(statements):
+            stmt = statements[i]
+            info.size += 1
+            if isinstance(stmt, ast.FunctionRef) and i + 1 < len(statements) and isinstance(statements[i + 1], ast.FunctionCall):
+                callee = self.inline_info(stmt.name)
+                if callee is None or depth < len(callee.params): return None
+                info.free |= callee.free
+                info.size += callee.size
+                depth += 1 - len(callee.params)
+                i += 2
+                continue
+
+            if type(stmt) in STACK_EFFECTS:
+                effect, needed = STACK_EFFECTS[type(stmt)]
+                if depth < needed: return None
+                if isinstance(stmt, ast.Load):
+                    if stmt.name in info.stored and stmt.name not in assigned: return None
+                    if stmt.name not in info.params and stmt.name not in info.stored: info.free.add(stmt.name)
+                elif isinstance(stmt, ast.Store):
+                    assigned.add(stmt.name)
+                depth += effect
+
+            elif isinstance(stmt, ast.Conditional):
+                if depth < 1: return None
+                then_assigned = set(assigned)
+                then_depth = self.analyze_inline(stmt.then_block.statements, depth - 1, then_assigned, info)
+                if stmt.else_block:
+                    else_assigned = set(assigned)
+                    else_depth = self.analyze_inline(stmt.else_block.statements, depth - 1, else_assigned, info)
+                    assigned |= then_assigned & else_assigned
+                else:
+                    else_depth = depth - 1
+                if then_depth is None or then_depth != else_depth: return None
+                depth = then_depth
+
+            elif isinstance(stmt, ast.ListLiteral):
+                inner = self.analyze_inline(stmt.program.statements, depth, assigned, info)
+                num_items = len(stmt.program.statements)
+                if inner is None or inner - num_items < 0: return None
+                depth = inner - num_items + 1
+
+            elif isinstance(stmt, ast.MapLiteral):
+                for _, value_prog in stmt.pairs:
+                    depth = self.analyze_inline(value_prog.statements, depth + 1, assigned, info)
+                    if depth is None: return None
+                if depth - 2 * len(stmt.pairs) < 0: return None
+                depth = depth - 2 * len(stmt.pairs) + 1
+
+            else:
+                # Loops, calls through variables, nested definitions and I/O keep a real frame
+                return None
+            i += 1
+        return depth
+
+    def emit_inline(self, name: str, call: ast.FunctionCall):
+        func = self.functions[name]
+        self.inline_count += 1
+        suffix = f"#{self.inline_count}"
+        # '.' and '#' cannot appear in a Sym identifier, so the fresh names never clash
+        renames = {local: f"{name}.{local}{suffix}" for local in sorted(set(func.params) | stored_names(func.body))}
+
+        original_renames = self.renames
+        self.renames = renames
+        # One instruction binds all arguments the way CALL does, and names the callee if some are missing
+        if func.params:
+            self.emit(bytecode.Opcode.BIND_ARGS, (name, tuple(renames[param] for param in func.params)), node=call)
+        self.visit_statements(func.body.statements)
+        self.renames = original_renames
 
     def visit_Push(self, node: ast.Push): self.emit(bytecode.Opcode.PUSH, node.value, node=node)
     def visit_Add(self, node: ast.Add): self.emit(bytecode.Opcode.ADD, node=node)
@@ -67,8 +214,8 @@ class Compiler:
     def visit_Or(self, node: ast.Or): self.emit(bytecode.Opcode.OR, node=node)
     def visit_Not(self, node: ast.Not): self.emit(bytecode.Opcode.NOT, node=node)
     
-    def visit_Store(self, node: ast.Store): self.emit(bytecode.Opcode.STORE_NAME, node.name, node=node)
-    def visit_Load(self, node: ast.Load): self.emit(bytecode.Opcode.LOAD_NAME, node.name, node=node)
+    def visit_Store(self, node: ast.Store): self.emit(bytecode.Opcode.STORE_NAME, self.renames.get(node.name, node.name), node=node)
+    def visit_Load(self, node: ast.Load): self.emit(bytecode.Opcode.LOAD_NAME, self.renames.get(node.name, node.name), node=node)
     
     def visit_Dup(self, node: ast.Dup): self.emit(bytecode.Opcode.DUP, node=node)
     def visit_Swap(self, node: ast.Swap): self.emit(bytecode.Opcode.SWAP, node=node)
@@ -77,7 +224,13 @@ class Compiler:
     
     def visit_Print(self, node: ast.Print): self.emit(bytecode.Opcode.PRINT, node=node)
     def visit_Input(self, node: ast.Input): self.emit(bytecode.Opcode.INPUT, node=node)
+    def visit_InputAll(self, node: ast.InputAll): self.emit(bytecode.Opcode.INPUT_ALL, node=node)
+    def visit_InputLines(self, node: ast.InputLines): self.emit(bytecode.Opcode.INPUT_LINES, node=node)
+    def visit_InputEof(self, node: ast.InputEof): self.emit(bytecode.Opcode.INPUT_EOF, node=node)
+    def visit_MapFile(self, node: ast.MapFile): self.emit(bytecode.Opcode.MAP_FILE, node=node)
+    def visit_SplitColumns(self, node: ast.SplitColumns): self.emit(bytecode.Opcode.SPLIT_COLUMNS, node=node)
     def visit_DebugBreak(self, node: ast.DebugBreak): self.emit(bytecode.Opcode.DBG, node=node)
+    def visit_Snapshot(self, node: ast.Snapshot): self.emit(bytecode.Opcode.SNAPSHOT, node=node)
 
     def visit_Conditional(self, node: ast.Conditional):
         # The condition value is already on the stack.
@@ -117,9 +270,13 @@ class Compiler:
     def visit_FunctionDef(self, node: ast.FunctionDef):
         original_chunk = self.visiting_chunk
         original_debug_map = self.visiting_debug_map
+        original_locals = self.visiting_locals
+        original_main = self.visiting_main
         
         self.visiting_chunk = []
         self.visiting_debug_map = []
+        self.visiting_locals = set(node.params) | stored_names(node.body)
+        self.visiting_main = False
         
         self.visit(node.body)
         self.emit(bytecode.Opcode.RETURN, node=node)
@@ -129,6 +286,8 @@ class Compiler:
         
         self.visiting_chunk = original_chunk
         self.visiting_debug_map = original_debug_map
+        self.visiting_locals = original_locals
+        self.visiting_main = original_main
         
     def visit_FunctionRef(self, node: ast.FunctionRef):
         self.emit(bytecode.Opcode.BUILD_CLOSURE, node.name, node=node)
@@ -137,4 +296,38 @@ class Compiler:
         self.emit(bytecode.Opcode.CALL, node=node)
     
     def visit_FfiCall(self, node: ast.FfiCall):
-        self.emit(bytecode.Opcode.FFI_CALL, node=node)
\ No newline at end of file
+        self.emit(bytecode.Opcode.FFI_CALL, node=node)
+
+def stored_names(program: ast.Program) -> Set[str]:
+    """Every name a block assigns to, including inside nested blocks of the same function."""
+    names = set()
+    for stmt in program.statements:
+        if isinstance(stmt, ast.Store): names.add(stmt.name)
+        elif isinstance(stmt, ast.Conditional):
+            names |= stored_names(stmt.then_block)
+            if stmt.else_block: names |= stored_names(stmt.else_block)
+        elif isinstance(stmt, ast.WhileLoop):
+            names |= stored_names(stmt.condition_block) | stored_names(stmt.body_block)
+        elif isinstance(stmt, ast.ListLiteral):
+            names |= stored_names(stmt.program)
+        elif isinstance(stmt, ast.MapLiteral):
+            for _, value_prog in stmt.pairs: names |= stored_names(value_prog)
+    return names
+
+
+def function_defs(program: ast.Program):
+    """Yields every function definition in `program`, including ones nested in blocks and other functions."""
+    for stmt in program.statements:
+        if isinstance(stmt, ast.FunctionDef):
+            yield stmt
+            yield from function_defs(stmt.body)
+        elif isinstance(stmt, ast.Conditional):
+            yield from function_defs(stmt.then_block)
+            if stmt.else_block: yield from function_defs(stmt.else_block)
+        elif isinstance(stmt, ast.WhileLoop):
+            yield from function_defs(stmt.condition_block)
+            yield from function_defs(stmt.body_block)
+        elif isinstance(stmt, ast.ListLiteral):
+            yield from function_defs(stmt.program)
+        elif isinstance(stmt, ast.MapLiteral):
+            for _, value_prog in stmt.pairs: yield from function_defs(value_prog)
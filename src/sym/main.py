@@ -4,31 +4,58 @@ from pathlib import Path
 import sys # <-- ADDED THIS LINE
 from sym.parser import parse_file
 from sym.compiler import Compiler
-from sym.vm import VirtualMachine
+from sym.vm import VirtualMachine, Limits
 
 def main():
     parser = argparse.ArgumentParser(description="Sym Language Engine")
-    parser.add_argument("file", help="Sym source file to execute")
+    parser.add_argument("file", nargs="?", help="Sym source file to execute")
     parser.add_argument("--debug", action="store_true", help="Enable the interactive debugger")
+    parser.add_argument("--no-inline", action="store_true", help="Keep a real call frame for every function call")
+    parser.add_argument("--save-image", metavar="PATH", help="Write a VM image to PATH when the program reaches 'snap'")
+    parser.add_argument("--image", metavar="PATH", help="Resume execution from a VM image instead of a source file")
+    parser.add_argument("--max-instructions", type=int, metavar="N", help="Stop the program after N executed instructions")
+    parser.add_argument("--max-stack", type=int, metavar="N", help="Stop the program if the data stack grows past N values")
+    parser.add_argument("--max-call-depth", type=int, metavar="N", help="Stop the program if calls nest deeper than N frames")
+    parser.add_argument("--max-heap", type=int, metavar="N", help="Stop the program if lists, maps and strings hold more than N items/characters")
+    parser.add_argument("--usage", action="store_true", help="Print resource usage counters to stderr when the program ends")
     args = parser.parse_args()
 
-    main_file = Path(args.file)
+    if (args.file is None) == (args.image is None):
+        parser.error("expected exactly one of a source file or --image")
+
+    main_file = Path(args.image or args.file)
     if not main_file.exists():
         print(f"Error: File not found: {main_file}")
         return
 
     try:
-        # 1. Parse main file and all imports into a single, combined AST
-        ast = parse_file(main_file, set())
-        
-        # 2. Compile the combined AST to bytecode chunks and debug maps
-        compiler = Compiler()
-        chunks, debug_maps = compiler.compile(ast)
-        
+        if args.image:
+            # Resume from a snapshot: parsing, compiling and init code are skipped
+            try:
+                vm = VirtualMachine.load_image(main_file)
+            except ValueError as e:
+                print(f"An error occurred during setup: {e}", file=sys.stderr)
+                return
+        else:
+            # 1. Parse main file and all imports into a single, combined AST
+            ast = parse_file(main_file, set())
+            
+            # 2. Compile the combined AST to bytecode chunks and debug maps
+            compiler = Compiler(inline=not args.no_inline)
+            chunks, debug_maps = compiler.compile(ast)
+            vm = VirtualMachine(chunks, debug_maps)
+
         # 3. Execute on the VM
-        vm = VirtualMachine(chunks, debug_maps)
+        vm.image_path = args.save_image
+        vm.limits = Limits(args.max_instructions, args.max_stack, args.max_call_depth, args.max_heap)
+        vm.meter_heap = args.usage
         vm.run(debug=args.debug)
         print() # Final newline
+        if args.save_image and not vm.image_written:
+            print(f"Warning: no image was written to {args.save_image}; the program never reached a 'snap' point", file=sys.stderr)
+        if args.usage:
+            for name, value in vm.usage().items():
+                print(f"{name}: {value}", file=sys.stderr)
 
     except (FileNotFoundError, NotImplementedError, TypeError) as e:
         print(f"An error occurred during setup: {e}", file=sys.stderr)
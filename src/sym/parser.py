@@ -74,9 +74,15 @@ class ASTTransformer(Transformer):
 
     # --- I/O & Debug ---
     def input(self, meta, _): return ast.Input(meta)
+    def input_all(self, meta, _): return ast.InputAll(meta)
+    def input_lines(self, meta, _): return ast.InputLines(meta)
+    def input_eof(self, meta, _): return ast.InputEof(meta)
+    def map_file(self, meta, _): return ast.MapFile(meta)
+    def split_columns(self, meta, _): return ast.SplitColumns(meta)
     def print(self, meta, _): return ast.Print(meta)
     def ffi_call(self, meta, _): return ast.FfiCall(meta)
     def debug_break(self, meta, _): return ast.DebugBreak(meta)
+    def snapshot(self, meta, _): return ast.Snapshot(meta)
 
 def parse_file(filepath: Path, visited_files: set) -> ast.Program:
     if filepath in visited_files:
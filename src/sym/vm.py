@@ -1,9 +1,31 @@
 # src/sym/vm.py
 import sys
 import ctypes
+import mmap
+import pickle
+from array import array
+import zlib
+from pathlib import Path
 from typing import List, Dict, Any, Tuple
 
-from sym.bytecode import Opcode
+from sym.bytecode import Opcode, OPERAND_OPCODES
+
+# --- VM Images ---
+IMAGE_MAGIC = b"SYMIMG"
+IMAGE_VERSION = 1
+IMAGE_FIELDS = {
+    'opcodes': list, 'chunks': dict, 'debug_maps': dict, 'globals': dict,
+    'stack': list, 'ip': int, 'ffi_libs': list,
+}
+
+# Allocated units after which the live heap is sampled for `peak_heap`, at the least
+HEAP_SAMPLE_MIN = 1024
+
+class SymRuntimeError(Exception):
+    """Raised for VM-level failures that have no natural Python exception type."""
+
+class ResourceLimitExceeded(SymRuntimeError):
+    """Raised when a program goes over one of the budgets in its VM's `Limits`."""
 
 # --- VM Object Models ---
 class Closure:
@@ -11,6 +33,142 @@ class Closure:
         self.name = name; self.params = params; self.chunk = chunk
     def __repr__(self): return f"<closure {self.name}>"
 
+def strip_line_ending(line: str) -> str:
+    """Drops one trailing '\\n' and then one '\\r', the only line endings the input words split on."""
+    return line.removesuffix("\n").removesuffix("\r")
+
+class MappedLines:
+    """A read-only, memory-mapped view of a text file that `get` and `len` index by line.
+
+    Only the newline offsets are kept in memory; each line is decoded when it is read.
+    """
+    def __init__(self, path: str):
+        # open() would treat an int as a file descriptor and close it afterwards
+        if not isinstance(path, str): raise TypeError(f"mmap expects a file path string, got '{type(path).__name__}'")
+        self.path = path
+        with open(path, 'rb') as f:
+            size = f.seek(0, 2)
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self.starts = array('q', [0])
+        pos = self.data.find(b"\n")
+        while pos != -1:
+            self.starts.append(pos + 1)
+            pos = self.data.find(b"\n", pos + 1)
+        if self.starts[-1] == len(self.data): self.starts.pop() # No line after a final newline
+
+    def __len__(self): return len(self.starts)
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0: index += len(self.starts)
+        if not 0 <= index < len(self.starts): raise IndexError(f"line {index} out of range for '{self.path}'")
+        end = self.starts[index + 1] if index + 1 < len(self.starts) else len(self.data)
+        return strip_line_ending(self.data[self.starts[index]:end].decode())
+
+    def __iter__(self):
+        for i in range(len(self.starts)): yield self[i]
+
+    def __reduce__(self): return (MappedLines, (self.path,)) # Images remap the file on load
+    def __repr__(self): return f"<mmap {self.path}: {len(self)} lines>"
+
+# Column types tried in order; a column widens to the next one when a value does not parse
+COLUMN_TYPES = (int, float, str)
+
+def split_columns(lines, sep: str) -> List[List[Any]]:
+    """Splits every non-empty line on `sep` (whitespace if empty) and returns one list per column.
+
+    Lines are read and converted in a single pass, so only the resulting
+    columns are held in memory. Each column holds ints, else floats, else strings.
+    """
+    if not isinstance(sep, str): raise TypeError(f"splitcols expects a separator string, got '{type(sep).__name__}'")
+    if not isinstance(lines, (list, MappedLines)): raise TypeError(f"splitcols expects a list of lines, got '{type(lines).__name__}'")
+
+    columns, kinds, widened = [], [], set()
+    for line_num, line in enumerate(lines):
+        if not isinstance(line, str): raise TypeError(f"splitcols expects lines to be strings, got '{type(line).__name__}'")
+        if not line: continue
+        fields = line.split(sep) if sep else line.split()
+        if not fields: continue
+        if not columns:
+            columns = [[] for _ in fields]; kinds = [0] * len(fields)
+        elif len(fields) != len(columns):
+            raise IndexError(f"line {line_num} has {len(fields)} columns, expected {len(columns)}")
+        for i, field in enumerate(fields):
+            while True:
+                try:
+                    columns[i].append(COLUMN_TYPES[kinds[i]](field)); break
+                except ValueError:
+                    kinds[i] += 1 # str never fails, so this ends
+                    if columns[i]: widened.add(i)
+
+    # Values converted before a column widened are re-read from the text, so they match the final type exactly
+    for i in widened:
+        convert = COLUMN_TYPES[kinds[i]]
+        rows = (line.split(sep) if sep else line.split() for line in lines if line)
+        columns[i] = [convert(fields[i]) for fields in rows if fields]
+    return columns
+
+# Item types a container can hold without holding other containers
+LEAF_ITEM_TYPES = frozenset({int, float, bool, str, type(None), Closure})
+
+def heap_size(roots, leaf_sizes=None) -> int:
+    """Approximate heap units reachable from `roots`: one per list item, map entry or string character.
+
+    Containers reachable through several paths are only counted once. If
+    `leaf_sizes` is given, it is replaced with the sizes of the containers that
+    hold no other containers, keyed by id, and sizes already in it are reused.
+    The caller must drop an entry whenever its container is modified.
+    """
+    known = leaf_sizes or {}
+    found = {}
+    seen = set()
+    total = 0
+    pending = list(roots)
+    while pending:
+        obj = pending.pop()
+        if isinstance(obj, str): total += len(obj)
+        elif isinstance(obj, (list, dict, MappedLines)):
+            if id(obj) in seen: continue
+            seen.add(id(obj))
+            entry = known.get(id(obj))
+            if entry is None or entry[0] is not obj:
+                items = obj if isinstance(obj, list) else obj.values() if isinstance(obj, dict) else ()
+                kinds = set(map(type, items))
+                if not kinds <= LEAF_ITEM_TYPES:
+                    total += len(obj)
+                    pending.extend(items)
+                    continue
+                entry = (obj, len(obj) + (sum(len(item) for item in items if isinstance(item, str)) if str in kinds else 0))
+            found[id(obj)] = entry
+            total += entry[1]
+    if leaf_sizes is not None:
+        leaf_sizes.clear()
+        leaf_sizes.update(found)
+    return total
+
+def instruction_offsets(chunk: List[Any]) -> array:
+    """Maps every chunk position to the number of instructions that start before it.
+
+    The VM counts executed instructions per straight-line block as the
+    difference of two entries, instead of once per dispatched instruction.
+    """
+    offsets = array('q', bytes(8 * (len(chunk) + 1)))
+    count = 0
+    ip = 0
+    while ip < len(chunk):
+        width = 2 if chunk[ip] in OPERAND_OPCODES else 1
+        count += 1
+        for pos in range(ip + 1, min(ip + width, len(chunk)) + 1): offsets[pos] = count
+        ip += width
+    return offsets
+
+class Limits:
+    """Per-VM resource budgets. A budget of None is unlimited."""
+    def __init__(self, max_instructions=None, max_stack_depth=None, max_call_depth=None, max_heap=None):
+        self.max_instructions = max_instructions
+        self.max_stack_depth = max_stack_depth
+        self.max_call_depth = max_call_depth
+        self.max_heap = max_heap # In `heap_size` units
+
 class Frame:
     def __init__(self, closure: Closure, ip: int, stack_start: int):
         self.closure = closure; self.ip = ip; self.stack_start = stack_start
@@ -25,6 +183,31 @@ class VirtualMachine:
         self.call_stack: List[Frame] = []
         self.ffi_libs = {}
         self.globals: Dict[str, Any] = {} # The global scope dictionary
+        self.image_path = None # Where a 'snap' instruction writes the VM image
+        self.image_written = False
+        self.input = sys.stdin
+        self.pending_line = None # A line read ahead by 'ineof', handed out by the next read
+
+        # Metering. Instructions are counted per straight-line block at jumps, calls and
+        # returns; stack depth is sampled at backward jumps and calls, so its peak is approximate.
+        self.limits = Limits()
+        self.instructions = 0
+        self.block_start = 0 # ip in the current frame where the uncounted block began
+        self.offsets = {name: instruction_offsets(chunk if name == '__main__' else chunk[1])
+                        for name, chunk in chunks.items()}
+        self.peak_stack_depth = 0
+        self.peak_call_depth = 1
+
+        # Heap accounting runs only with a heap budget, or when `meter_heap` asks for the counters
+        self.meter_heap = False
+        self.heap_allocated = 0 # Total units allocated over the run
+        self.heap_live = 0 # Live units as of the last heap measurement
+        self.heap_unmeasured = 0 # Units allocated since that measurement
+        self.heap_next_measure = 0 # Unmeasured units that trigger the next measurement
+        self.heap_backoff = 0
+        self.heap_leaf_sizes = {} # Sizes of containers without nested containers, reused between measurements
+        self.peak_heap = 0 # Largest live heap seen by a measurement; sampled, see schedule_heap_measure
+        self.error = None # The exception that stopped the last run, if any
 
         # Setup main frame
         main_closure = Closure('__main__', [], chunks['__main__'])
@@ -32,6 +215,7 @@ class VirtualMachine:
 
 
     def run(self, debug=False):
+        self.block_start = self.current_frame().ip
         try:
             while self.current_frame().ip < len(self.current_chunk()):
                 if debug and self.read_op_for_debug() == Opcode.DBG:
@@ -47,14 +231,21 @@ class VirtualMachine:
                                 Opcode.AND, Opcode.OR):
                     b, a = self.stack.pop(), self.stack.pop()
                     if opcode == Opcode.ADD:
-                        if isinstance(a, list): self.stack.append(a + (b if isinstance(b, list) else [b]))
-                        elif isinstance(a, str): self.stack.append(a + str(b))
+                        if isinstance(a, list): self.stack.append(a + (b if isinstance(b, list) else [b])); self.charge_heap()
+                        elif isinstance(a, str): self.stack.append(a + str(b)); self.charge_heap()
                         elif isinstance(a, (int, float)) and isinstance(b, (int, float)): self.stack.append(a + b)
                         else: raise TypeError(f"Unsupported operand types for +: '{type(a).__name__}' and '{type(b).__name__}'")
                     elif opcode == Opcode.SUB: self.stack.append(a - b)
-                    elif opcode == Opcode.MUL: self.stack.append(a * b)
+                    elif opcode == Opcode.MUL:
+                        # Repeating a list or string allocates; refuse before building a result that alone breaks the budget
+                        if isinstance(a, (list, str)) and isinstance(b, int): self.reserve_heap(len(a) * b)
+                        elif isinstance(b, (list, str)) and isinstance(a, int): self.reserve_heap(len(b) * a)
+                        self.stack.append(a * b)
+                        if isinstance(self.stack[-1], (list, str)): self.charge_heap()
                     elif opcode == Opcode.DIV: self.stack.append(a / b if isinstance(a, float) or isinstance(b, float) else a // b)
-                    elif opcode == Opcode.MOD: self.stack.append(a % b)
+                    elif opcode == Opcode.MOD:
+                        self.stack.append(a % b)
+                        if isinstance(self.stack[-1], str): self.charge_heap() # String formatting
                     elif opcode == Opcode.EQ: self.stack.append(int(a == b))
                     elif opcode == Opcode.NEQ: self.stack.append(int(a != b))
                     elif opcode == Opcode.LT: self.stack.append(int(a < b))
@@ -87,10 +278,17 @@ class VirtualMachine:
                     else:
                         raise NameError(f"name '{name}' is not defined")
                 
-                elif opcode == Opcode.JUMP: self.current_frame().ip = self.read_operand()
+                elif opcode == Opcode.JUMP:
+                    addr = self.read_operand()
+                    self.charge_block()
+                    # Every loop iteration ends in a backward jump, so checking here bounds runaway loops
+                    if addr < self.current_frame().ip: self.check_limits()
+                    self.current_frame().ip = self.block_start = addr
                 elif opcode == Opcode.JUMP_IF_FALSE:
                     addr = self.read_operand()
-                    if not self.stack.pop(): self.current_frame().ip = addr
+                    if not self.stack.pop():
+                        self.charge_block()
+                        self.current_frame().ip = self.block_start = addr
 
                 elif opcode == Opcode.BUILD_CLOSURE:
                     func_name = self.read_operand()
@@ -106,18 +304,33 @@ class VirtualMachine:
                         if not self.stack: raise IndexError(f"Not enough arguments for function '{callee.name}'")
                         frame.locals[param_name] = self.stack.pop()
                     
+                    # Checked before the frame is pushed, so errors point at the CALL
+                    self.charge_block()
+                    self.check_limits(call_depth=len(self.call_stack) + 1)
                     self.call_stack.append(frame)
+                    self.block_start = 0
+
+                elif opcode == Opcode.BIND_ARGS:
+                    # Argument binding for a call the compiler inlined into this frame
+                    func_name, names = self.read_operand()
+                    if len(self.stack) < len(names): raise IndexError(f"Not enough arguments for function '{func_name}'")
+                    frame_locals = self.current_frame().locals
+                    for name in reversed(names):
+                        frame_locals[name] = self.stack.pop()
 
                 elif opcode == Opcode.RETURN:
                     return_val = self.stack.pop()
+                    self.charge_block()
                     frame_to_pop = self.call_stack.pop()
                     if not self.call_stack: break
+                    self.block_start = self.current_frame().ip
                     self.stack = self.stack[:frame_to_pop.stack_start]
                     self.stack.append(return_val)
                     
                 elif opcode == Opcode.BUILD_LIST:
                     num_items = self.read_operand()
                     self.stack.append([self.stack.pop() for _ in range(num_items)][::-1])
+                    self.charge_heap()
                 elif opcode == Opcode.BUILD_MAP:
                     num_pairs = self.read_operand()
                     new_map = {}
@@ -125,19 +338,43 @@ class VirtualMachine:
                         val, key = self.stack.pop(), self.stack.pop()
                         new_map[key].append(val)
                     self.stack.append(new_map)
+                    self.charge_heap()
                 elif opcode == Opcode.GET_ITEM: key, obj = self.stack.pop(), self.stack.pop(); self.stack.append(obj[key])
-                elif opcode == Opcode.SET_ITEM: val, key, obj = self.stack.pop(), self.stack.pop(); obj[key] = val; self.stack.append(obj)
+                elif opcode == Opcode.SET_ITEM:
+                    val, key, obj = self.stack.pop(), self.stack.pop(), self.stack.pop()
+                    grows = isinstance(obj, dict) and key not in obj
+                    obj[key] = val; self.stack.append(obj)
+                    self.heap_leaf_sizes.pop(id(obj), None)
+                    if grows: self.charge_heap(1)
                 elif opcode == Opcode.LEN: self.stack.append(len(self.stack.pop()))
 
                 elif opcode == Opcode.PRINT:
                     print(self.stack.pop(), end="", flush=True)
                 
-                elif opcode == Opcode.INPUT: self.stack.append(sys.stdin.readline().strip())
+                elif opcode == Opcode.INPUT: self.stack.append(self.read_line().strip()); self.charge_heap()
+                elif opcode == Opcode.INPUT_ALL: self.stack.append(self.read_lines(-1)); self.charge_heap(deep=True)
+                elif opcode == Opcode.INPUT_LINES:
+                    count = self.stack.pop()
+                    if not isinstance(count, int) or count < 0: raise TypeError(f"inlines expects a non-negative integer count, got {count!r}")
+                    self.stack.append(self.read_lines(count)); self.charge_heap(deep=True)
+                elif opcode == Opcode.INPUT_EOF:
+                    if self.pending_line is None: self.pending_line = self.input.readline()
+                    self.stack.append(int(self.pending_line == ""))
+                elif opcode == Opcode.MAP_FILE: self.stack.append(MappedLines(self.stack.pop())); self.charge_heap()
+                elif opcode == Opcode.SPLIT_COLUMNS:
+                    sep, lines = self.stack.pop(), self.stack.pop()
+                    self.stack.append(split_columns(lines, sep))
+                    self.charge_heap(deep=True)
                 elif opcode == Opcode.FFI_CALL: self.ffi_call()
                 elif opcode == Opcode.DBG: pass
+                elif opcode == Opcode.SNAPSHOT:
+                    if self.image_path is not None: self.save_image(self.image_path)
         
-        except (IndexError, KeyError, TypeError, NameError, ZeroDivisionError, FileNotFoundError) as e:
+        except (IndexError, KeyError, TypeError, NameError, ZeroDivisionError, OSError, UnicodeDecodeError, SymRuntimeError) as e:
+            self.error = e
             self.generate_error_report(e)
+        finally:
+            if self.call_stack: self.charge_block() # The block that ended the run
 
     def read_op(self):
         op = self.current_chunk()[self.current_frame().ip]
@@ -156,6 +393,111 @@ class VirtualMachine:
     def current_chunk(self):
         return self.current_frame().closure.chunk
 
+    def charge_block(self):
+        """Counts the instructions executed in the current frame since `block_start`."""
+        frame = self.call_stack[-1]
+        offsets = self.offsets[frame.closure.name]
+        self.instructions += offsets[frame.ip] - offsets[self.block_start]
+        self.block_start = frame.ip
+
+    def check_limits(self, call_depth=None):
+        # Record every peak first, so usage() is accurate even after a budget error
+        limits = self.limits
+        stack_depth = len(self.stack)
+        if call_depth is None: call_depth = len(self.call_stack)
+        if stack_depth > self.peak_stack_depth: self.peak_stack_depth = stack_depth
+        if call_depth > self.peak_call_depth: self.peak_call_depth = call_depth
+
+        if limits.max_instructions is not None and self.instructions > limits.max_instructions:
+            raise ResourceLimitExceeded(f"instruction budget of {limits.max_instructions} exceeded")
+        if limits.max_stack_depth is not None and stack_depth > limits.max_stack_depth:
+            raise ResourceLimitExceeded(f"stack depth budget of {limits.max_stack_depth} exceeded")
+        if limits.max_call_depth is not None and call_depth > limits.max_call_depth:
+            raise ResourceLimitExceeded(f"call depth budget of {limits.max_call_depth} exceeded")
+
+    def reserve_heap(self, size: int):
+        max_heap = self.limits.max_heap
+        if max_heap is not None and size > max_heap:
+            raise ResourceLimitExceeded(f"heap budget of {max_heap} exceeded")
+
+    def charge_heap(self, size=None, deep=False):
+        """Accounts for `size` new units, or for the object just pushed by an allocating instruction.
+
+        The object is charged its own `len()`, or its full `heap_size` when
+        `deep` is set for freshly read data whose items are new as well.
+        """
+        if self.limits.max_heap is None and not self.meter_heap: return
+        if size is None: size = heap_size([self.stack[-1]]) if deep else len(self.stack[-1])
+        self.heap_allocated += size
+        self.heap_unmeasured += size
+        if self.heap_unmeasured >= self.heap_next_measure:
+            self.measure_heap()
+            if self.limits.max_heap is not None and self.heap_live > self.limits.max_heap:
+                raise ResourceLimitExceeded(f"heap budget of {self.limits.max_heap} exceeded")
+
+    def measure_heap(self) -> int:
+        roots = self.stack + list(self.globals.values())
+        for frame in self.call_stack: roots.extend(frame.locals.values())
+        self.heap_live = heap_size(roots, self.heap_leaf_sizes)
+        self.heap_unmeasured = 0
+        if self.heap_live > self.peak_heap: self.peak_heap = self.heap_live
+        self.schedule_heap_measure()
+        return self.heap_live
+
+    def schedule_heap_measure(self):
+        """Sets how many units may be allocated before the live heap is walked again.
+
+        The heap is walked once it may have doubled, for `peak_heap`, or once it
+        may have crossed the budget. Close to the budget the gap grows
+        geometrically up to an eighth of the budget, so every walk is paid for
+        by that many allocated units, and the budget can be overshot by as much.
+        """
+        gap = max(self.heap_live, HEAP_SAMPLE_MIN)
+        max_heap = self.limits.max_heap
+        if max_heap is not None:
+            slack = max_heap - self.heap_live
+            cap = max(max_heap // 8, 1)
+            if slack >= cap:
+                self.heap_backoff = 0
+                gap = min(gap, slack + 1)
+            else:
+                self.heap_backoff = min(max(self.heap_backoff * 2, HEAP_SAMPLE_MIN), cap)
+                gap = min(gap, max(slack + 1, self.heap_backoff))
+        self.heap_next_measure = gap
+
+    def usage(self) -> Dict[str, int]:
+        """Resource counters for billing and capacity planning; valid during and after `run`."""
+        self.measure_heap()
+        return {
+            'instructions': self.instructions,
+            'peak_stack_depth': max(self.peak_stack_depth, len(self.stack)),
+            'peak_call_depth': self.peak_call_depth,
+            'heap_allocated': self.heap_allocated,
+            'heap_live': self.heap_live,
+            'peak_heap': self.peak_heap,
+        }
+
+    def read_line(self) -> str:
+        if self.pending_line is not None:
+            line, self.pending_line = self.pending_line, None
+            return line
+        return self.input.readline()
+
+    def read_lines(self, count: int) -> List[str]:
+        """Reads up to `count` lines (all remaining if negative) without their line endings."""
+        lines = []
+        while count != 0:
+            if count < 0 and self.pending_line is None:
+                # Split on '\n' only; str.splitlines() would also break at '\f', '\v' and friends
+                rest = self.input.read().split("\n")
+                if rest[-1] == "": rest.pop() # No line after a final newline
+                lines.extend(strip_line_ending(line) for line in rest)
+                break
+            line = self.read_line()
+            if not line: break
+            lines.append(strip_line_ending(line)); count -= 1
+        return lines
+
     def ffi_call(self):
         func_name, lib_path = self.stack.pop(), self.stack.pop()
         if lib_path not in self.ffi_libs:
@@ -172,6 +514,60 @@ class VirtualMachine:
         
         self.stack.append(c_func(*args))
 
+    def save_image(self, path: Path):
+        """Writes the compiled chunks and the current top-level state to `path`.
+
+        Execution resumes at the instruction after the snapshot point when the
+        image is loaded, so no parsing, compiling or init code runs again.
+        """
+        if len(self.call_stack) != 1:
+            raise SymRuntimeError(f"cannot snapshot inside function '{self.current_frame().closure.name}'")
+
+        state = {
+            'opcodes': [op.name for op in Opcode],
+            'chunks': self.chunks,
+            'debug_maps': self.debug_maps,
+            'globals': self.globals,
+            'stack': self.stack,
+            'ip': self.current_frame().ip,
+            'ffi_libs': list(self.ffi_libs),
+        }
+        try:
+            payload = zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            raise SymRuntimeError(f"VM state cannot be written to an image: {e}")
+        Path(path).write_bytes(IMAGE_MAGIC + bytes([IMAGE_VERSION]) + payload)
+        self.image_written = True
+
+    @classmethod
+    def load_image(cls, path: Path) -> 'VirtualMachine':
+        """Rebuilds a VirtualMachine from an image written by `save_image`."""
+        data = Path(path).read_bytes()
+        header_len = len(IMAGE_MAGIC) + 1
+        if len(data) <= len(IMAGE_MAGIC) or data[:len(IMAGE_MAGIC)] != IMAGE_MAGIC:
+            raise ValueError(f"{path} is not a Sym image")
+        if data[len(IMAGE_MAGIC)] != IMAGE_VERSION:
+            raise ValueError(f"{path} has unsupported image version {data[len(IMAGE_MAGIC)]}")
+
+        try:
+            state = pickle.loads(zlib.decompress(data[header_len:]))
+        except (zlib.error, pickle.UnpicklingError, EOFError, AttributeError, ImportError, IndexError, TypeError):
+            # Corrupt data, or classes that were renamed or removed since the image was written
+            raise ValueError(f"{path} is not a Sym image")
+        if not isinstance(state, dict) or any(not isinstance(state.get(key), kind) for key, kind in IMAGE_FIELDS.items()) \
+                or '__main__' not in state['chunks']:
+            raise ValueError(f"{path} is not a Sym image")
+        if state['opcodes'] != [op.name for op in Opcode]:
+            raise ValueError(f"{path} was built by an incompatible Sym version; rebuild the image")
+
+        vm = cls(state['chunks'], state['debug_maps'])
+        vm.globals = state['globals']
+        vm.stack = state['stack']
+        vm.current_frame().ip = state['ip']
+        for lib_path in state['ffi_libs']:
+            vm.ffi_libs[lib_path] = ctypes.CDLL(lib_path)
+        return vm
+
     def generate_error_report(self, e: Exception):
         frame = self.current_frame()
         if frame.closure.name not in self.debug_maps or not self.debug_maps[frame.closure.name]: